@@ -3,8 +3,16 @@
 import subprocess
 import time
 import argparse
+import atexit
+import queue
+import re
+import shlex
+import shutil
+import signal
 import sys
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Union
 
 # --- UI Enhancements: ANSI Colors ---
 class Colors:
@@ -19,53 +27,273 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# --- Output ---
+# All output is queued and written by one thread, so lines from the per-device
+# workers come out whole and in order, batched into a few writes per tick.
+_out_q: 'queue.SimpleQueue[str]' = queue.SimpleQueue()
+_out_lock = threading.Lock()
+_FLUSH_INTERVAL = 0.05
+_writer_started = False
+
+def flush_output():
+    """Writes out everything queued so far."""
+    with _out_lock:
+        chunks = []
+        while True:
+            try:
+                chunks.append(_out_q.get_nowait())
+            except queue.Empty:
+                break
+        if chunks:
+            sys.stdout.write(''.join(chunks))
+            sys.stdout.flush()
+
+def _output_writer():
+    """Background loop that periodically flushes queued output."""
+    while True:
+        time.sleep(_FLUSH_INTERVAL)
+        flush_output()
+
+def _emit(text: str):
+    """Queues text for output, starting the writer thread on first use rather than at import."""
+    global _writer_started
+    _out_q.put(text)
+    if not _writer_started:
+        with _out_lock:
+            if not _writer_started:
+                threading.Thread(target=_output_writer, daemon=True).start()
+                atexit.register(flush_output)
+                _writer_started = True
+
+def echo(message: str = ""):
+    """Queues a line of plain output."""
+    _emit(message + '\n')
+
 def print_color(color: str, message: str):
     """Prints a message in the specified color."""
-    print(f"{color}{message}{Colors.ENDC}")
+    _emit(color + message + Colors.ENDC + '\n')
+
+def prompt(text: str) -> str:
+    """Flushes pending output, then reads a line of user input."""
+    flush_output()
+    return input(text)
 
 # --- Core Logic ---
+# A phone number: optional leading '+' followed by 6 to 15 digits (use with fullmatch).
+_PHONE_RE = re.compile(rb'\+?\d{6,15}')
+# Set by Ctrl+C while sending, to cut the current wait between recipients short.
+_skip_wait = threading.Event()
+# Set by a second Ctrl+C within _ABORT_WINDOW seconds, to stop sending altogether.
+_abort = threading.Event()
+_ABORT_WINDOW = 2.0
+_last_interrupt = 0.0
+# How often a running batch checks whether sending was stopped.
+_CANCEL_POLL_INTERVAL = 0.2
+# Starts adb processes outside the terminal's process group, so the Ctrl+C used
+# to skip waits doesn't also kill the shell session or an intent in flight.
+_DETACHED = (
+    {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP} if sys.platform == 'win32'
+    else {'start_new_session': True}
+)
+# Matches the serial of each authorized device in raw `adb devices` output.
+_DEVICE_LINE_RE = re.compile(rb'^(\S+)\tdevice\b', re.M)
+# Fixed parts of the on-device 'am start' command that opens the SMS app, already shell-quoted.
+_AM_START_PREFIX = 'am start -a android.intent.action.SENDTO'
+_AM_START_SUFFIX = '--ez exit_on_sent true'
+# Marker echoed after each command in a persistent shell session, followed by its exit code.
+_DONE_SENTINEL = '__DONE__'
+# Marker echoed after each intent in a batched shell script, followed by its exit code.
+_RC_SENTINEL = '__RC__'
+_RC_LINE_RE = re.compile(rb'^' + _RC_SENTINEL.encode() + rb'(\d+)', re.M)
+# Older adb transports cap a shell command at 4 KB (including the service prefix),
+# so batched scripts are split to stay under this many bytes.
+_BATCH_SCRIPT_LIMIT = 4000
+
 class AdbSmsHelper:
-    """A helper class to interact with an Android device via ADB for sending SMS intents."""
+    """
+    A helper class to interact with an Android device via ADB for sending SMS intents.
+
+    Used as a context manager, it keeps a single `adb shell` session open and
+    runs every intent through it instead of spawning a new adb process per message.
+
+    The first helper created for a given adb binary starts the adb server, so every
+    later command in this process (from any helper or thread) talks to a warm daemon.
+    """
+
+    _started_servers: set = set()
+    _server_lock = threading.Lock()
+
+    def __init__(self, adb_path: str = 'adb', serial: Optional[str] = None):
+        # Resolve adb once so each spawn doesn't repeat the PATH search.
+        resolved_path = shutil.which(adb_path)
+        if resolved_path is None:
+            raise FileNotFoundError(f"The command '{adb_path}' was not found.")
+        self.adb_path = resolved_path
+        self.serial = serial
+        # Names the device in output, since several devices may be printing at once.
+        self._target = f" on {serial}" if serial else ""
+        self._ensure_server()
+        # Every intent command starts the same way; build that part once.
+        self._shell_prefix = self._adb_command('shell')
+        self.proc: Optional[subprocess.Popen] = None
+        self._output: 'queue.Queue[Optional[str]]' = queue.Queue()
+
+    def _ensure_server(self):
+        """Starts the adb server once per process, instead of on the first real command."""
+        with AdbSmsHelper._server_lock:
+            if self.adb_path in AdbSmsHelper._started_servers:
+                return
+            try:
+                subprocess.run(
+                    [self.adb_path, 'start-server'],
+                    stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                    timeout=10
+                )
+            except subprocess.TimeoutExpired:
+                # Not fatal: the next adb command will start the server or report the problem.
+                return
+            AdbSmsHelper._started_servers.add(self.adb_path)
+
+    def __enter__(self) -> 'AdbSmsHelper':
+        self.proc = subprocess.Popen(
+            self._shell_prefix,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            # Android's shell is UTF-8; don't let the host locale (e.g. cp1252) pick the codec.
+            text=True, encoding='utf-8', errors='replace', bufsize=1, **_DETACHED
+        )
+        # readline() can't time out, so a reader thread feeds lines into a queue we can wait on.
+        threading.Thread(target=self._pump_output, args=(self.proc,), daemon=True).start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._close_session()
+
+    def _pump_output(self, proc: subprocess.Popen):
+        """Forwards the session's output to the queue; None marks the end of the stream."""
+        for line in proc.stdout:
+            self._output.put(line)
+        self._output.put(None)
+
+    def _close_session(self):
+        """Ends the persistent shell session, if one is open."""
+        if self.proc is None:
+            return
+        proc, self.proc = self.proc, None
+        try:
+            proc.stdin.write('exit\n')
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+
+    def _drain_session_output(self, timeout: float = 1.0) -> str:
+        """Collects what an ended session printed that hasn't been read yet, up to end of stream."""
+        lines = []
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                line = self._output.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if line is None:
+                break
+            lines.append(line)
+        return ''.join(lines).strip()
 
-    def __init__(self, adb_path: str = 'adb'):
-        self.adb_path = adb_path
+    def _run_in_session(self, command_line: str, timeout: float) -> Optional[tuple[int, str]]:
+        """
+        Runs a command in the persistent shell session and waits for it to finish.
 
-    def check_device_connection(self) -> bool:
+        Returns:
+            The command's exit code and everything it printed, or None if the
+            session had already ended (e.g. the device went offline), in which
+            case the command was not run and the session has been closed.
+        """
+        try:
+            if self.proc.poll() is not None:
+                raise BrokenPipeError
+            self.proc.stdin.write(f"{command_line}; echo {_DONE_SENTINEL}$?\n")
+            self.proc.stdin.flush()
+        except OSError:
+            details = self._drain_session_output()
+            self._close_session()
+            print_color(Colors.WARNING, f"ADB shell session{self._target} ended; falling back to one-off commands.")
+            if details:
+                print_color(Colors.WARNING, f"ADB Output: {details}")
+            return None
+
+        deadline = time.monotonic() + timeout
+        output = []
+        while True:
+            try:
+                line = self._output.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                # The session is in an unknown state; drop it and fall back to one-off commands.
+                self._close_session()
+                raise subprocess.TimeoutExpired(command_line, timeout)
+            if line is None:
+                self._close_session()
+                details = ''.join(output).strip()
+                raise RuntimeError(f"ADB shell session ended unexpectedly: {details}" if details
+                                   else "ADB shell session ended unexpectedly.")
+            if line.startswith(_DONE_SENTINEL):
+                return int(line[len(_DONE_SENTINEL):].strip()), ''.join(output)
+            output.append(line)
+
+    def _adb_command(self, *args: str) -> List[str]:
+        """Builds an adb command line, targeting this helper's device if a serial is set."""
+        if self.serial:
+            return [self.adb_path, '-s', self.serial, *args]
+        return [self.adb_path, *args]
+
+    def _am_start_line(self, phone_number: str, message: str) -> str:
+        """
+        Builds the on-device 'am start' command line that opens the SMS app.
+        The device shell re-parses it, so the per-recipient arguments are quoted.
+        """
+        return (
+            f"{_AM_START_PREFIX} -d {shlex.quote(f'sms:{phone_number}')} "
+            f"--es sms_body {shlex.quote(message)} {_AM_START_SUFFIX}"
+        )
+
+    def check_device_connection(self, required_serials: Optional[List[str]] = None) -> bool:
         """
         Checks for connected and authorized ADB devices.
-        Returns True if at least one device is ready, False otherwise.
+        Returns True if at least one device is ready (and every serial in
+        `required_serials` is among them), False otherwise.
         """
         print_color(Colors.OKBLUE, "Checking for connected ADB devices...")
         try:
             result = subprocess.run(
                 [self.adb_path, 'devices'],
-                capture_output=True, text=True, check=True, timeout=10
+                capture_output=True, check=True, timeout=10
             )
-            device_lines = result.stdout.strip().split('\n')
-            # Filter for lines that represent an active, authorized device
-            connected_devices = [line for line in device_lines[1:] if line.strip() and "\tdevice" in line]
+            # Only lines for active, authorized devices end in a tab followed by 'device'
+            connected_devices = _DEVICE_LINE_RE.findall(result.stdout)
 
             if not connected_devices:
                 print_color(Colors.FAIL, "\nError: No authorized Android device found.")
-                print("Please ensure that:")
-                print("1. Your phone is connected via USB.")
-                print("2. 'USB Debugging' is enabled in Developer Options.")
-                print("3. You have authorized this computer for debugging on your phone.")
+                echo("Please ensure that:")
+                echo("1. Your phone is connected via USB.")
+                echo("2. 'USB Debugging' is enabled in Developer Options.")
+                echo("3. You have authorized this computer for debugging on your phone.")
                 return False
             else:
                 print_color(Colors.OKGREEN, "\nFound connected device(s):")
-                for device in connected_devices:
-                    print(f"- {device.split()[0]}")
+                connected_serials = [device.decode() for device in connected_devices]
+                for serial in connected_serials:
+                    echo(f"- {serial}")
+
+                missing = [serial for serial in required_serials or [] if serial not in connected_serials]
+                if missing:
+                    print_color(Colors.FAIL, f"\nError: Requested device(s) not connected: {', '.join(missing)}")
+                    return False
                 return True
 
-        except FileNotFoundError:
-            print_color(Colors.FAIL, f"Error: The command '{self.adb_path}' was not found.")
-            print("Please install Android SDK Platform Tools and ensure 'adb' is in your system's PATH.")
-            return False
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
             print_color(Colors.FAIL, f"An error occurred while checking for ADB devices: {e}")
-            if hasattr(e, 'stderr'):
-                print(f"ADB Error Output: {e.stderr}")
+            if e.stderr:
+                echo(f"ADB Error Output: {e.stderr.decode(errors='replace').strip()}")
             return False
 
     def send_sms_intent(self, phone_number: str, message: str) -> bool:
@@ -80,34 +308,25 @@ class AdbSmsHelper:
         Returns:
             True if the ADB command was sent successfully, False otherwise.
         """
-        print(f"\nAttempting to open SMS composer for {Colors.OKCYAN}{phone_number}{Colors.ENDC}...")
+        echo(f"\nAttempting to open SMS composer for {Colors.OKCYAN}{phone_number}{Colors.ENDC}{self._target}...")
         
-        # The 'am start' command to open the SMS app.
-        # No extra quotes are needed around the message; subprocess handles arguments.
-        command = [
-            self.adb_path, 'shell', 'am', 'start',
-            '-a', 'android.intent.action.SENDTO',
-            '-d', f'sms:{phone_number}',
-            '--es', 'sms_body', message,
-            '--ez', 'exit_on_sent', 'true'
-        ]
+        command_line = self._am_start_line(phone_number, message)
 
         try:
-            # Using Popen to get more control and avoid blocking indefinitely if the shell hangs
-            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            stdout, stderr = process.communicate(timeout=15)
-
-            if process.returncode == 0:
-                print_color(Colors.OKGREEN, "Intent sent successfully! Please check your phone to tap 'Send'.")
-                return True
+            outcome = self._run_in_session(command_line, timeout=15) if self.proc is not None else None
+            if outcome is not None:
+                returncode, stderr = outcome
             else:
-                print_color(Colors.FAIL, f"Error sending intent for {phone_number}.")
-                if stderr:
-                    # Often, the error message from 'am' is on stderr.
-                    print_color(Colors.FAIL, f"ADB Error: {stderr.strip()}")
-                else:
-                    print_color(Colors.WARNING, "ADB command failed with no specific error message.")
-                return False
+                # No session, or it ended before this intent was written to it.
+                # Only the exit code and stderr matter, so stdout is discarded rather than piped.
+                result = subprocess.run(
+                    [*self._shell_prefix, command_line],
+                    stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                    timeout=15, **_DETACHED
+                )
+                returncode, stderr = result.returncode, result.stderr
+
+            return self._report_intent_result(phone_number, returncode, stderr)
 
         except subprocess.TimeoutExpired:
             print_color(Colors.FAIL, f"ADB command timed out for {phone_number}.")
@@ -116,21 +335,165 @@ class AdbSmsHelper:
             print_color(Colors.FAIL, f"An unexpected error occurred for {phone_number}: {e}")
             return False
 
+    def _report_intent_result(self, phone_number: str, returncode: int, stderr: Union[str, bytes]) -> bool:
+        """
+        Prints the outcome of an intent command and returns whether it succeeded.
+        Raw stderr bytes are only decoded if there is an error to show.
+        """
+        if returncode == 0:
+            print_color(Colors.OKGREEN, f"Intent sent successfully for {phone_number}{self._target}! Please check your phone to tap 'Send'.")
+            return True
+        else:
+            print_color(Colors.FAIL, f"Error sending intent for {phone_number}{self._target}.")
+            if stderr:
+                if isinstance(stderr, bytes):
+                    stderr = stderr.decode(errors='replace')
+                # Often, the error message from 'am' is on stderr.
+                print_color(Colors.FAIL, f"ADB Error: {stderr.strip()}")
+            else:
+                print_color(Colors.WARNING, "ADB command failed with no specific error message.")
+            return False
+
+    def send_sms_batch(self, pairs: List[tuple[str, str]], delay: int = 0,
+                       cancel: Optional[threading.Event] = None) -> List[bool]:
+        """
+        Opens the SMS composer for several recipients using as few `adb shell` calls as possible.
+        The intents run as on-device scripts, sleeping `delay` seconds between them. Scripts
+        are split so each stays under the adb command size limit.
+
+        Args:
+            pairs: (phone_number, message) tuples, in sending order.
+            delay: Seconds to wait on the device between intents.
+            cancel: If given and set, stops the running batch and skips the rest.
+
+        Returns:
+            One entry per pair, True if that intent was sent successfully.
+        """
+        commands = [
+            f"{self._am_start_line(number, message)}; echo {_RC_SENTINEL}$?"
+            for number, message in pairs
+        ]
+        separator = f"; sleep {delay}; " if delay else "; "
+        batches = self._split_batch(commands, separator)
+        echo(f"\nOpening SMS composer for {len(pairs)} recipient(s){self._target} in {len(batches)} batch(es)...")
+
+        results: List[bool] = []
+        for i, batch in enumerate(batches):
+            if i:
+                # Keep the delay between the last intent of one batch and the first of the next.
+                if cancel is not None:
+                    cancel.wait(delay)
+                else:
+                    time.sleep(delay)
+            if cancel is not None and cancel.is_set():
+                break
+            results.extend(self._run_batch(separator.join(batch), len(batch), delay, cancel))
+        # Intents that never ran because sending was stopped count as failures.
+        attempted = len(results)
+        results.extend([False] * (len(pairs) - attempted))
+
+        for i, ((number, _), sent) in enumerate(zip(pairs, results)):
+            if i >= attempted:
+                print_color(Colors.WARNING, f"Skipped {number}{self._target}.")
+            elif sent:
+                print_color(Colors.OKGREEN, f"Intent sent successfully for {number}{self._target}!")
+            else:
+                print_color(Colors.FAIL, f"Error sending intent for {number}{self._target}.")
+        return results
+
+    def _split_batch(self, commands: List[str], separator: str) -> List[List[str]]:
+        """Groups commands into scripts that each fit within `_BATCH_SCRIPT_LIMIT` bytes."""
+        batches: List[List[str]] = []
+        current: List[str] = []
+        size = 0
+        separator_size = len(separator.encode())
+        for command in commands:
+            command_size = len(command.encode())
+            # A single command over the limit still gets a batch of its own.
+            if current and size + separator_size + command_size > _BATCH_SCRIPT_LIMIT:
+                batches.append(current)
+                current, size = [], 0
+            size += command_size + (separator_size if current else 0)
+            current.append(command)
+        if current:
+            batches.append(current)
+        return batches
+
+    def _run_batch(self, script: str, count: int, delay: int,
+                   cancel: Optional[threading.Event] = None) -> List[bool]:
+        """
+        Runs one batched script of `count` intents and returns their outcomes.
+        The script is killed if `cancel` is set while it runs, in which case
+        only the intents that already ran are returned.
+        """
+        deadline = time.monotonic() + 15 + count * 2 + delay * (count - 1)
+        try:
+            process = subprocess.Popen(
+                [*self._shell_prefix, script],
+                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                **_DETACHED
+            )
+            # Wait in short slices so a stop request doesn't have to sit out the on-device sleeps.
+            while True:
+                try:
+                    stdout, stderr = process.communicate(timeout=_CANCEL_POLL_INTERVAL)
+                    break
+                except subprocess.TimeoutExpired:
+                    if cancel is not None and cancel.is_set():
+                        process.kill()
+                        stdout, _ = process.communicate()
+                        # Only the intents that reported back actually ran.
+                        return [code == b'0' for code in _RC_LINE_RE.findall(stdout)[:count]]
+                    if time.monotonic() > deadline:
+                        process.kill()
+                        process.communicate()
+                        print_color(Colors.FAIL, f"ADB batch command timed out{self._target}.")
+                        return [False] * count
+        except Exception as e:
+            print_color(Colors.FAIL, f"An unexpected error occurred while sending the batch{self._target}: {e}")
+            return [False] * count
+
+        return_codes = _RC_LINE_RE.findall(stdout)
+        # Intents the script never reached (e.g. adb failed early) count as failures.
+        results = [i < len(return_codes) and return_codes[i] == b'0' for i in range(count)]
+        if not all(results) and stderr:
+            print_color(Colors.FAIL, f"ADB Error: {stderr.decode(errors='replace').strip()}")
+        return results
+
+def parse_recipients(recipient_input: str) -> List[str]:
+    """
+    Splits comma-separated input into phone numbers, dropping entries that
+    aren't valid numbers so they never cost an adb round-trip.
+    """
+    recipient_numbers = []
+    rejected = []
+    # Stripping blanks and splitting on bytes keeps the per-entry work in C for huge lists.
+    # Line breaks go too, so a pasted multi-line list still parses.
+    for entry in recipient_input.encode().translate(None, b' \t\r\n').split(b','):
+        if _PHONE_RE.fullmatch(entry):
+            recipient_numbers.append(entry.decode())
+        elif entry:
+            rejected.append(entry.decode())
+
+    if rejected:
+        print_color(Colors.WARNING, f"Ignoring invalid phone number(s): {', '.join(rejected)}")
+    return recipient_numbers
+
 def run_interactive_mode() -> tuple[List[str], str]:
     """Runs the script in interactive mode, prompting the user for input."""
     while True:
-        recipient_input = input(f"Enter recipient phone number(s) (comma-separated): ").strip()
+        recipient_input = prompt(f"Enter recipient phone number(s) (comma-separated): ").strip()
         if not recipient_input:
             print_color(Colors.WARNING, "Input cannot be empty. Please try again.")
             continue
-        recipient_numbers = [num.strip() for num in recipient_input.split(',') if num.strip()]
+        recipient_numbers = parse_recipients(recipient_input)
         if recipient_numbers:
             break
         else:
             print_color(Colors.WARNING, "No valid phone numbers entered. Please try again.")
 
     while True:
-        message_text = input("Enter the message content: ").strip()
+        message_text = prompt("Enter the message content: ").strip()
         if message_text:
             break
         else:
@@ -138,6 +501,66 @@ def run_interactive_mode() -> tuple[List[str], str]:
     
     return recipient_numbers, message_text
 
+def shard_recipients(recipient_numbers: List[str], serials: List[Optional[str]]) -> Dict[Optional[str], List[str]]:
+    """Distributes recipients round-robin across the target devices."""
+    shards: Dict[Optional[str], List[str]] = {serial: [] for serial in serials}
+    for i, number in enumerate(recipient_numbers):
+        shards[serials[i % len(serials)]].append(number)
+    return {serial: numbers for serial, numbers in shards.items() if numbers}
+
+def send_to_device(serial: Optional[str], numbers: List[str], message_text: str, delay: int, batch: bool = False) -> int:
+    """
+    Sends the message to each number in turn on a single device.
+    Sends to one device stay sequential: each intent opens the composer and
+    waits for the user to tap 'Send', so the delay gives them time to do so.
+    With `batch`, all intents go to the device in a single adb call.
+
+    Returns:
+        The number of intents sent successfully.
+    """
+    if batch:
+        pairs = [(number, message_text) for number in numbers]
+        results = AdbSmsHelper(serial=serial).send_sms_batch(pairs, delay, cancel=_abort)
+        if len(numbers) > 1:
+            print_color(Colors.OKBLUE, "Please check your phone to tap 'Send' for each message.")
+        return sum(results)
+
+    successful_sends = 0
+
+    with AdbSmsHelper(serial=serial) as helper:
+        for i, number in enumerate(numbers):
+            if _abort.is_set():
+                break
+            started = time.monotonic()
+            if helper.send_sms_intent(number, message_text):
+                successful_sends += 1
+            
+            if i < len(numbers) - 1:
+                # The delay counts from when this intent was started, so the adb
+                # round-trip overlaps with it instead of adding to it.
+                remaining = max(0.0, delay - (time.monotonic() - started))
+                print_color(Colors.OKBLUE, f"\nWaiting {remaining:.1f} seconds before next recipient. Press Ctrl+C to skip, twice to stop.")
+                # KeyboardInterrupt only reaches the main thread, so workers wait on an event instead.
+                # Clearing first means a press made during the send doesn't skip this wait.
+                _skip_wait.clear()
+                if _skip_wait.wait(remaining) and not _abort.is_set():
+                    print_color(Colors.WARNING, "\nWait skipped by user.")
+
+    return successful_sends
+
+def _handle_interrupt(signum, frame):
+    """
+    SIGINT handler while sending: a press skips the current wait, and a second
+    press within _ABORT_WINDOW seconds stops sending to the remaining recipients.
+    """
+    global _last_interrupt
+    now = time.monotonic()
+    if now - _last_interrupt < _ABORT_WINDOW and not _abort.is_set():
+        print_color(Colors.WARNING, "\nStopping... no further intents will be sent.")
+        _abort.set()
+    _last_interrupt = now
+    _skip_wait.set()
+
 def main():
     """Main function to parse arguments and execute the script."""
     parser = argparse.ArgumentParser(
@@ -151,53 +574,79 @@ Examples:
   Direct mode:
     python main.py -n "+15551234567" -m "Hello there!"
     python main.py -n "+15551234567,+15557654321" -m "Group message" -d 10
+
+  Multiple devices (recipients are split between them and sent in parallel):
+    python main.py -n "+15551234567,+15557654321" -m "Hi" -s emulator-5554,R58M123ABC
 """
     )
     parser.add_argument("-n", "--numbers", help="One or more recipient phone numbers, comma-separated.")
     parser.add_argument("-m", "--message", help="The content of the SMS message.")
     parser.add_argument("-d", "--delay", type=int, default=7, help="Delay in seconds between sending to multiple recipients (default: 7).")
+    parser.add_argument("-s", "--serial", help="One or more ADB device serials, comma-separated. Recipients are split across devices.")
+    parser.add_argument("-b", "--batch", action="store_true", help="Send each device's intents in as few adb calls as possible. The delay then runs on the device and\ncan't be skipped; press Ctrl+C twice to stop.")
 
     args = parser.parse_args()
 
     print_color(Colors.HEADER, "--- ADB SMS Sender ---")
-    print("Prepares SMS messages on your phone. You must tap 'Send' manually on the device.\n")
+    echo("Prepares SMS messages on your phone. You must tap 'Send' manually on the device.\n")
 
-    helper = AdbSmsHelper()
-    if not helper.check_device_connection():
+    serials: List[Optional[str]] = [s.strip() for s in args.serial.split(',') if s.strip()] if args.serial else []
+
+    try:
+        helper = AdbSmsHelper()
+    except FileNotFoundError as e:
+        print_color(Colors.FAIL, f"Error: {e}")
+        echo("Please install Android SDK Platform Tools and ensure 'adb' is in your system's PATH.")
+        sys.exit(1)
+    if not helper.check_device_connection(serials):
         sys.exit(1)
+    if not serials:
+        # Let adb pick the single connected device.
+        serials = [None]
 
     if args.numbers and args.message:
         # Direct mode from arguments
-        recipient_numbers = [num.strip() for num in args.numbers.split(',')]
+        recipient_numbers = parse_recipients(args.numbers)
+        if not recipient_numbers:
+            print_color(Colors.FAIL, "Error: No valid phone numbers provided.")
+            sys.exit(1)
         message_text = args.message
-        print("\nUsing provided arguments:")
+        echo("\nUsing provided arguments:")
     else:
         # Interactive mode
         recipient_numbers, message_text = run_interactive_mode()
-        print("\n--- Summary ---")
+        echo("\n--- Summary ---")
     
-    print(f"{Colors.BOLD}Recipient(s):{Colors.ENDC} {', '.join(recipient_numbers)}")
-    print(f"{Colors.BOLD}Message:{Colors.ENDC} \"{message_text}\"")
+    echo(f"{Colors.BOLD}Recipient(s):{Colors.ENDC} {', '.join(recipient_numbers)}")
+    echo(f"{Colors.BOLD}Message:{Colors.ENDC} \"{message_text}\"")
     
-    confirm = input("Proceed? (y/n): ").strip().lower()
+    confirm = prompt("Proceed? (y/n): ").strip().lower()
     if confirm != 'y':
         print_color(Colors.WARNING, "Operation cancelled.")
         sys.exit(0)
 
     successful_sends = 0
     total_sends = len(recipient_numbers)
+    shards = shard_recipients(recipient_numbers, serials)
 
-    for i, number in enumerate(recipient_numbers):
-        if helper.send_sms_intent(number, message_text):
-            successful_sends += 1
-        
-        if i < total_sends - 1:
-            try:
-                print_color(Colors.OKBLUE, f"\nWaiting {args.delay} seconds before next recipient. Press Ctrl+C to skip.")
-                time.sleep(args.delay)
-            except KeyboardInterrupt:
-                print_color(Colors.WARNING, "\nWait skipped by user.")
+    # While sending, Ctrl+C skips the current wait and a quick second press stops sending.
+    _skip_wait.clear()
+    _abort.clear()
+    previous_handler = signal.signal(signal.SIGINT, _handle_interrupt)
+    try:
+        # One worker per device; each device works through its share sequentially.
+        with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            futures = [
+                executor.submit(send_to_device, serial, numbers, message_text, args.delay, args.batch)
+                for serial, numbers in shards.items()
+            ]
+            for future in as_completed(futures):
+                successful_sends += future.result()
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
 
+    if _abort.is_set():
+        print_color(Colors.WARNING, "\nSending stopped by user; the remaining recipients were skipped.")
     print_color(Colors.HEADER, "\n--- Task Complete ---")
     print_color(Colors.OKGREEN, f"Successfully initiated: {successful_sends} of {total_sends} messages.")
     if successful_sends < total_sends: